@@ -38,12 +38,13 @@ def main() -> None:
     
     # Get events from primary calendar
     print("3. Fetching recent events from primary calendar...")
-    events = exporter.get_events(
+    events = list(exporter.get_events(
         calendar_id='primary',
         days_back=7,      # Last 7 days
         days_forward=7,   # Next 7 days
-        max_results=10    # Limit to 10 events
-    )
+        max_results=10,   # Limit to 10 events
+        include_attendees=True
+    ))
     
     print(f"Found {len(events)} events")
     
@@ -7,21 +7,215 @@ It handles authentication, retrieves calendar events, and exports them with
 detailed metadata including attendees, locations, descriptions, and more.
 """
 
+import argparse
+import itertools
 import json
 import os
-import pickle
-from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from types import ModuleType
+from typing import List, Dict, Any, Callable, Iterable, Iterator, Optional, Tuple
+from urllib.parse import quote
 
-from google.auth.transport.requests import Request  # type: ignore
-from google_auth_oauthlib.flow import InstalledAppFlow  # type: ignore
-from googleapiclient.discovery import build  # type: ignore
+# The Google auth, discovery and HTTP libraries are imported lazily in
+# authenticate() so that argument parsing (e.g. --help) stays fast.
 from googleapiclient.errors import HttpError  # type: ignore
-import argparse
 
-# If modifying these scopes, delete the file token.pickle.
+# orjson is an optional speedup; fall back to the stdlib json module
+orjson: Optional[ModuleType]
+try:
+    import orjson as _orjson
+    orjson = _orjson
+except ImportError:
+    orjson = None
+
+# If modifying these scopes, delete the file token.json.
 SCOPES = ['https://www.googleapis.com/auth/calendar.readonly']
 
+# File that stores the user's access and refresh tokens between runs
+TOKEN_FILE = 'token.json'
+
+# How long a fetched calendar list is reused within one process
+CALENDAR_LIST_TTL = timedelta(minutes=5)
+
+# Color definitions almost never change, so they are cached on disk for a day
+CACHE_DIR = '.cache'
+COLOR_CACHE_FILE = os.path.join(CACHE_DIR, 'colors.json')
+COLOR_CACHE_TTL = timedelta(hours=24)
+
+# Incremental sync state (sync token plus raw events) is kept per calendar.
+# Full syncs fetch this much extra on both sides of the requested range so the
+# sync token stays usable as the range moves with the current date.
+SYNC_CACHE_DIR = os.path.join(CACHE_DIR, 'sync')
+SYNC_WINDOW_PADDING = timedelta(days=7)
+
+# Refresh cached access tokens this long before they actually expire
+TOKEN_REFRESH_MARGIN = timedelta(minutes=5)
+
+# Attendee response statuses that count as accepting an event
+ACCEPTED_STATUSES = frozenset({'accepted', 'tentative'})
+
+# Partial response masks limiting API responses to the fields this tool reads
+EVENT_ITEM_FIELDS = (
+    'id,summary,description,location,start,end,created,updated,'
+    'organizer(email,self),'
+    'attendees(email,displayName,responseStatus,optional,organizer,self),'
+    'recurringEventId,colorId,eventType'
+)
+EVENT_LIST_FIELDS = f'nextPageToken,items({EVENT_ITEM_FIELDS})'
+EVENT_SYNC_FIELDS = f'nextPageToken,nextSyncToken,items(status,{EVENT_ITEM_FIELDS})'
+CALENDAR_FIELDS = 'id,summary,description,primary,accessRole,colorId,backgroundColor,foregroundColor'
+CALENDAR_LIST_FIELDS = f'items({CALENDAR_FIELDS})'
+COLOR_FIELDS = 'calendar,event'
+
+# Number of events requested per page when listing events
+PAGE_SIZE = 250
+
+# Size of the write buffer used when exporting events
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Maximum number of calendars fetched concurrently by get_events_many()
+MAX_WORKERS = 8
+
+# Maximum number of calls the Calendar API accepts in a single batch request
+BATCH_LIMIT = 50
+
+def _json_bytes(obj: Any, indent_prefix: Optional[bytes] = None) -> bytes:
+    """Serialize an object to UTF-8 encoded JSON.
+    
+    Args:
+        obj: JSON-serializable object
+        indent_prefix: If given, pretty-print with an indent of 2 and prefix
+            every continuation line so the value nests inside a larger
+            document; otherwise produce compact single-line JSON
+        
+    Returns:
+        JSON bytes, produced by orjson when it is installed
+    """
+    if orjson is not None:
+        if indent_prefix is None:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        data = orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2)
+    elif indent_prefix is None:
+        return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    else:
+        data = json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+    return data.replace(b'\n', b'\n' + indent_prefix) if indent_prefix else data
+
+def _utc_isoformat(moment: datetime) -> str:
+    """Format an aware UTC datetime as an RFC 3339 string with a 'Z' suffix.
+    
+    Args:
+        moment: Timezone-aware datetime in UTC
+        
+    Returns:
+        Timestamp string such as '2024-01-15T10:30:00Z'
+    """
+    return moment.isoformat(timespec='seconds').replace('+00:00', 'Z')
+
+def _time_range(days_back: int, days_forward: int) -> Tuple[str, str]:
+    """Calculate the RFC 3339 bounds of an event query around the current time.
+    
+    Args:
+        days_back: Number of days in the past to include
+        days_forward: Number of days in the future to include
+        
+    Returns:
+        Tuple of (time_min, time_max) strings
+    """
+    now = datetime.now(timezone.utc)
+    return (_utc_isoformat(now - timedelta(days=days_back)),
+            _utc_isoformat(now + timedelta(days=days_forward)))
+
+def _event_time(value: Dict[str, Any]) -> datetime:
+    """Convert an event start or end value from the API into an aware datetime.
+    
+    Args:
+        value: Raw 'start' or 'end' dictionary holding 'date' or 'dateTime'
+        
+    Returns:
+        Timezone-aware datetime; all-day dates are taken as midnight UTC
+    """
+    moment = datetime.fromisoformat(value.get('dateTime') or value.get('date') or '1970-01-01')
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment
+
+def _atomic_write(filename: str, text: str) -> None:
+    """Write text to a file through a temporary file and os.replace().
+    
+    An interrupted write therefore never leaves a truncated file behind.
+    
+    Args:
+        filename: Destination path
+        text: Content to write
+    """
+    tmp_file = filename + '.tmp'
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        f.write(text)
+    os.replace(tmp_file, filename)
+
+def _read_cache(filename: str, ttl: timedelta) -> Optional[Any]:
+    """Load a JSON cache file if it was written less than ttl ago.
+    
+    Args:
+        filename: Path of the cache file
+        ttl: Maximum age of the cache file
+        
+    Returns:
+        The cached data, or None if the file is missing, stale or unreadable
+    """
+    try:
+        age = datetime.now().timestamp() - os.path.getmtime(filename)
+        if age >= ttl.total_seconds():
+            return None
+        with open(filename, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def _write_cache(filename: str, data: Any) -> None:
+    """Atomically write data to a JSON cache file.
+    
+    Failures are reported but never interrupt the export.
+    
+    Args:
+        filename: Path of the cache file
+        data: JSON-serializable data to cache
+    """
+    try:
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        _atomic_write(filename, _json_bytes(data).decode('utf-8'))
+    except OSError as e:
+        print(f"Warning: Could not write cache file {filename}: {e}")
+
+@dataclass
+class ExportStats:
+    """Summary counters collected while events stream through an export."""
+    
+    total: int = 0
+    all_day: int = 0
+    timed: int = 0
+    with_attendees: int = 0
+    
+    def add(self, event: Dict[str, Any]) -> None:
+        """Count a processed event.
+        
+        Args:
+            event: Processed event dictionary
+        """
+        self.total += 1
+        if event['all_day']:
+            self.all_day += 1
+        else:
+            self.timed += 1
+        if event['attendees_count'] > 0:
+            self.with_attendees += 1
+
 class GoogleCalendarExporter:
     """Google Calendar API client for exporting events with metadata."""
     
@@ -34,6 +228,9 @@ class GoogleCalendarExporter:
         self.credentials_file: str = credentials_file
         self.service: Optional[Any] = None
         self.creds: Optional[Any] = None
+        self._calendars: Optional[List[Dict[str, Any]]] = None
+        self._calendars_fetched_at: float = 0.0
+        self._color_definitions: Optional[Dict[str, Any]] = None
         
     def authenticate(self) -> bool:
         """Authenticate with Google Calendar API.
@@ -41,26 +238,39 @@ class GoogleCalendarExporter:
         Returns:
             True if authentication successful, False otherwise
         """
-        # The file token.pickle stores the user's access and refresh tokens.
-        if os.path.exists('token.pickle'):
-            with open('token.pickle', 'rb') as token:
-                self.creds = pickle.load(token)
+        from google.auth.transport.requests import Request  # type: ignore
+        from google.oauth2.credentials import Credentials  # type: ignore
+        from google_auth_httplib2 import AuthorizedHttp  # type: ignore
+        from googleapiclient.discovery import build  # type: ignore
+        from googleapiclient.http import HttpRequest, build_http  # type: ignore
+        
+        # The file token.json stores the user's access and refresh tokens.
+        if os.path.exists(TOKEN_FILE):
+            try:
+                self.creds = Credentials.from_authorized_user_file(TOKEN_FILE, SCOPES)
+            except ValueError as e:
+                print(f"Warning: Ignoring invalid token file: {e}")
                 
-        # If there are no (valid) credentials available, let the user log in.
-        if not self.creds or not self.creds.valid:
-            if self.creds and self.creds.expired and self.creds.refresh_token:
+        # A cached token that stays valid past the safety margin needs neither
+        # a refresh nor a test call against the API.
+        token_fresh = self._token_is_fresh()
+                
+        # If there are no (fresh) credentials available, refresh or let the user log in.
+        if not token_fresh:
+            if self.creds and self.creds.refresh_token:
                 try:
                     self.creds.refresh(Request())
                 except Exception as e:
                     print(f"Error refreshing credentials: {e}")
                     # Delete the invalid token file and try again
-                    if os.path.exists('token.pickle'):
-                        os.remove('token.pickle')
+                    if os.path.exists(TOKEN_FILE):
+                        os.remove(TOKEN_FILE)
                     self.creds = None
             
             if not self.creds or not self.creds.valid:
                 try:
                     if os.path.exists(self.credentials_file):
+                        from google_auth_oauthlib.flow import InstalledAppFlow  # type: ignore
                         flow = InstalledAppFlow.from_client_secrets_file(
                             self.credentials_file, SCOPES)
                         self.creds = flow.run_local_server(port=0)
@@ -84,24 +294,56 @@ class GoogleCalendarExporter:
                     print(f"Error during OAuth flow: {e}")
                     return False
                 
-            # Save the credentials for the next run
+            # Save the credentials for the next run, atomically so an
+            # interrupted write never leaves a truncated token file behind
             try:
-                with open('token.pickle', 'wb') as token:
-                    pickle.dump(self.creds, token)
+                _atomic_write(TOKEN_FILE, self.creds.to_json())
             except Exception as e:
                 print(f"Warning: Could not save credentials: {e}")
                 
         # Build the service
         try:
-            self.service = build('calendar', 'v3', credentials=self.creds)
-            # Test the service by making a simple call
-            self.service.calendarList().list(maxResults=1).execute()  # type: ignore
+            # Each thread keeps one authorized HTTP client whose connection stays
+            # alive across API calls. httplib2 is not thread-safe, so clients
+            # are never shared between threads. build_http() applies the same
+            # socket timeout and redirect handling that build() uses by default.
+            thread_local = threading.local()
+            
+            def thread_http() -> Any:
+                """Return the calling thread's authorized HTTP client, creating it on first use."""
+                if not hasattr(thread_local, 'http'):
+                    thread_local.http = AuthorizedHttp(self.creds, http=build_http())
+                return thread_local.http
+            
+            def build_request(_http: Any, *args: Any, **kwargs: Any) -> Any:
+                """Build an HttpRequest on the calling thread's client instead of the shared one."""
+                return HttpRequest(thread_http(), *args, **kwargs)
+            
+            self.service = build('calendar', 'v3', http=thread_http(), requestBuilder=build_request)
+            if not token_fresh:
+                # Test the service with a call whose result get_calendars() reuses
+                self._cache_calendars(
+                    self.service.calendarList().list(fields=CALENDAR_LIST_FIELDS).execute())  # type: ignore
             return True
         except Exception as e:
             print(f"Error building Google Calendar service: {e}")
             self.service = None
             return False
     
+    def _token_is_fresh(self) -> bool:
+        """Check whether the cached access token is valid beyond the refresh margin.
+        
+        Returns:
+            True if the token expires more than TOKEN_REFRESH_MARGIN from now
+        """
+        if not self.creds or not self.creds.valid:
+            return False
+        expiry = getattr(self.creds, 'expiry', None)
+        if expiry is None:
+            return False
+        # google-auth stores the expiry as a naive UTC datetime
+        return expiry - datetime.now(timezone.utc).replace(tzinfo=None) > TOKEN_REFRESH_MARGIN
+    
     def get_calendars(self) -> List[Dict[str, Any]]:
         """Get list of all calendars accessible to the user.
         
@@ -112,82 +354,410 @@ class GoogleCalendarExporter:
             print("Error: Calendar service not initialized. Please authenticate first.")
             return []
         
-        try:
-            calendar_list = self.service.calendarList().list().execute()
-            calendars = []
-            
-            for calendar in calendar_list.get('items', []):
-                calendars.append({
-                    'id': calendar['id'],
-                    'summary': calendar.get('summary', 'Unknown'),
-                    'description': calendar.get('description', ''),
-                    'primary': calendar.get('primary', False),
-                    'access_role': calendar.get('accessRole', 'reader'),
-                    'color_id': calendar.get('colorId', ''),
-                    'background_color': calendar.get('backgroundColor', ''),
-                    'foreground_color': calendar.get('foregroundColor', '')
-                })
-                
+        calendars = self._cached_calendars()
+        if calendars is not None:
             return calendars
+        
+        try:
+            calendar_list = self.service.calendarList().list(fields=CALENDAR_LIST_FIELDS).execute()
+            return self._cache_calendars(calendar_list)
             
         except HttpError as error:
             print(f"An error occurred while fetching calendars: {error}")
             return []
     
+    def get_calendar(self, calendar_id: str) -> Optional[Dict[str, Any]]:
+        """Get metadata for a single calendar.
+        
+        Uses the cached calendar list when available and otherwise fetches
+        only the requested entry instead of the whole calendar list.
+        
+        Args:
+            calendar_id: Calendar ID, or 'primary' for the user's primary calendar
+            
+        Returns:
+            Calendar dictionary with metadata, or None if it could not be fetched
+        """
+        if self.service is None:
+            print("Error: Calendar service not initialized. Please authenticate first.")
+            return None
+        
+        for calendar in self._cached_calendars() or ():
+            if calendar['id'] == calendar_id or (calendar_id == 'primary' and calendar['primary']):
+                return calendar
+        
+        try:
+            calendar = self.service.calendarList().get(calendarId=calendar_id, fields=CALENDAR_FIELDS).execute()
+            return self._process_calendar(calendar)
+            
+        except HttpError as error:
+            print(f"An error occurred while fetching calendar {calendar_id}: {error}")
+            return None
+    
+    def _cache_calendars(self, calendar_list: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Process a calendarList().list() response and cache it for CALENDAR_LIST_TTL.
+        
+        Args:
+            calendar_list: Raw calendar list response from Google Calendar API
+            
+        Returns:
+            List of processed calendar dictionaries
+        """
+        self._calendars = [self._process_calendar(calendar) for calendar in calendar_list.get('items', [])]
+        self._calendars_fetched_at = time.monotonic()
+        return self._calendars
+    
+    def _cached_calendars(self) -> Optional[List[Dict[str, Any]]]:
+        """Return the cached calendar list if it is younger than CALENDAR_LIST_TTL.
+        
+        Returns:
+            List of processed calendar dictionaries, or None if not cached or stale
+        """
+        if time.monotonic() - self._calendars_fetched_at >= CALENDAR_LIST_TTL.total_seconds():
+            self._calendars = None
+        return self._calendars
+    
+    def _process_calendar(self, calendar: Dict[str, Any]) -> Dict[str, Any]:
+        """Process a raw calendar list entry into structured format.
+        
+        Args:
+            calendar: Raw calendar list entry from Google Calendar API
+            
+        Returns:
+            Processed calendar dictionary with metadata
+        """
+        return {
+            'id': calendar['id'],
+            'summary': calendar.get('summary', 'Unknown'),
+            'description': calendar.get('description', ''),
+            'primary': calendar.get('primary', False),
+            'access_role': calendar.get('accessRole', 'reader'),
+            'color_id': calendar.get('colorId', ''),
+            'background_color': calendar.get('backgroundColor', ''),
+            'foreground_color': calendar.get('foregroundColor', '')
+        }
+    
     def get_events(self, 
                    calendar_id: str = 'primary',
                    days_back: int = 30,
                    days_forward: int = 30,
-                   max_results: int = 1000) -> List[Dict[str, Any]]:
+                   max_results: int = 1000,
+                   event_filter: Optional[Callable[[Dict[str, Any]], bool]] = None,
+                   include_attendees: bool = False) -> Iterator[Dict[str, Any]]:
         """Get events from a specific calendar with metadata.
         
+        Events are fetched page by page and yielded as soon as they are
+        processed, so memory use stays constant regardless of the number
+        of events.
+        
         Args:
             calendar_id: Calendar ID to fetch events from
             days_back: Number of days in the past to fetch events
             days_forward: Number of days in the future to fetch events
-            max_results: Maximum number of events to return
+            max_results: Maximum number of events to fetch
+            event_filter: Optional predicate applied to raw API events before processing
+            include_attendees: Include the processed attendee list in each event
+            
+        Yields:
+            Event dictionaries with full metadata
+            
+        Raises:
+            HttpError: If any page fails to load, so that a partial result is
+                never mistaken for a complete one
+        """
+        if self.service is None:
+            print("Error: Calendar service not initialized. Please authenticate first.")
+            return
+        
+        time_min, time_max = _time_range(days_back, days_forward)
+        request = self._events_list_request(
+            calendar_id, time_min, time_max, min(PAGE_SIZE, max_results))
+        remaining = max_results
+        
+        while request is not None and remaining > 0:
+            response = request.execute()
+            events = response.get('items', [])[:remaining]
+            remaining -= len(events)
+            yield from self._process_events(events, event_filter, include_attendees)
+            request = self.service.events().list_next(request, response)
+    
+    def get_events_multi(self,
+                         calendar_ids: List[str],
+                         days_back: int = 30,
+                         days_forward: int = 30,
+                         max_results: int = 1000,
+                         event_filter: Optional[Callable[[Dict[str, Any]], bool]] = None,
+                         include_attendees: bool = False) -> Dict[str, List[Dict[str, Any]]]:
+        """Get events from several calendars using batched HTTP requests.
+        
+        Args:
+            calendar_ids: Calendar IDs to fetch events from
+            days_back: Number of days in the past to fetch events
+            days_forward: Number of days in the future to fetch events
+            max_results: Maximum number of events to fetch per calendar
+            event_filter: Optional predicate applied to raw API events before processing
+            include_attendees: Include the processed attendee list in each event
             
         Returns:
-            List of event dictionaries with full metadata
+            Dictionary mapping each calendar ID to its list of processed events
         """
+        results: Dict[str, List[Dict[str, Any]]] = {calendar_id: [] for calendar_id in calendar_ids}
         if self.service is None:
             print("Error: Calendar service not initialized. Please authenticate first.")
-            return []
+            return results
+        
+        time_min, time_max = _time_range(days_back, days_forward)
+        requests = [
+            self._events_list_request(calendar_id, time_min, time_max, min(PAGE_SIZE, max_results))
+            for calendar_id in calendar_ids
+        ]
+        # Calendars whose first page was truncated, with the response holding the
+        # page token and the number of events fetched so far
+        next_pages: List[Tuple[int, Dict[str, Any], int]] = []
+        
+        def callback(request_id: str, response: Dict[str, Any], exception: Optional[Exception]) -> None:
+            """Store the first page of one calendar and queue it if more pages follow."""
+            index = int(request_id)
+            calendar_id = calendar_ids[index]
+            if exception is not None:
+                print(f"An error occurred while fetching events for {calendar_id}: {exception}")
+                return
+            events = response.get('items', [])[:max_results]
+            results[calendar_id] = list(self._process_events(events, event_filter, include_attendees))
+            if response.get('nextPageToken') and len(events) < max_results:
+                next_pages.append((index, response, len(events)))
         
         try:
-            # Calculate time range
-            now = datetime.utcnow()
-            time_min = (now - timedelta(days=days_back)).isoformat() + 'Z'
-            time_max = (now + timedelta(days=days_forward)).isoformat() + 'Z'
-            
-            # Fetch events
-            events_result = self.service.events().list(
-                calendarId=calendar_id,
-                timeMin=time_min,
-                timeMax=time_max,
-                maxResults=max_results,
-                singleEvents=True,
-                orderBy='startTime'
-            ).execute()
-            
-            events = events_result.get('items', [])
-            processed_events = []
-            
-            for event in events:
-                processed_event = self._process_event(event)
-                processed_events.append(processed_event)
-                
-            return processed_events
+            # The Calendar API accepts at most BATCH_LIMIT calls per batch
+            for offset in range(0, len(calendar_ids), BATCH_LIMIT):
+                batch = self.service.new_batch_http_request(callback=callback)
+                for index in range(offset, min(offset + BATCH_LIMIT, len(calendar_ids))):
+                    batch.add(requests[index], request_id=str(index))
+                batch.execute()
             
         except HttpError as error:
             print(f"An error occurred while fetching events: {error}")
-            return []
+            return results
+        
+        # Remaining pages depend on the previous page token, so they are fetched in sequence
+        for index, response, fetched_count in next_pages:
+            calendar_id = calendar_ids[index]
+            processed_events = results[calendar_id]
+            try:
+                request = self.service.events().list_next(requests[index], response)
+                while request is not None and fetched_count < max_results:
+                    response = request.execute()
+                    events = response.get('items', [])[:max_results - fetched_count]
+                    fetched_count += len(events)
+                    processed_events.extend(self._process_events(events, event_filter, include_attendees))
+                    request = self.service.events().list_next(request, response)
+            except HttpError as error:
+                # Drop the partial result rather than returning a truncated calendar
+                print(f"An error occurred while fetching events for {calendar_id}: {error}")
+                results[calendar_id] = []
+            
+        return results
     
-    def _process_event(self, event: Dict[str, Any]) -> Dict[str, Any]:
+    def get_events_many(self,
+                        calendar_ids: List[str],
+                        days_back: int = 30,
+                        days_forward: int = 30,
+                        max_results: int = 1000,
+                        incremental: bool = False,
+                        event_filter: Optional[Callable[[Dict[str, Any]], bool]] = None,
+                        include_attendees: bool = False) -> Dict[str, List[Dict[str, Any]]]:
+        """Get events from several calendars concurrently.
+        
+        Unlike get_events_multi(), every calendar is paginated independently in
+        its own worker thread, which also allows incremental sync per calendar.
+        
+        Args:
+            calendar_ids: Calendar IDs to fetch events from
+            days_back: Number of days in the past to fetch events
+            days_forward: Number of days in the future to fetch events
+            max_results: Maximum number of events to fetch per calendar
+            incremental: Use sync_events() instead of get_events()
+            event_filter: Optional predicate applied to raw API events before processing
+            include_attendees: Include the processed attendee list in each event
+            
+        Returns:
+            Dictionary mapping each calendar ID to its list of processed events
+        """
+        fetch_events = self.sync_events if incremental else self.get_events
+        
+        def fetch_all(calendar_id: str) -> List[Dict[str, Any]]:
+            """Fetch every event of one calendar, or none if a request fails."""
+            try:
+                return list(fetch_events(calendar_id, days_back, days_forward, max_results,
+                                         event_filter, include_attendees))
+            except HttpError as error:
+                print(f"An error occurred while fetching events for {calendar_id}: {error}")
+                return []
+        
+        with ThreadPoolExecutor(max_workers=max(1, min(MAX_WORKERS, len(calendar_ids)))) as executor:
+            return dict(zip(calendar_ids, executor.map(fetch_all, calendar_ids)))
+    
+    def sync_events(self,
+                    calendar_id: str = 'primary',
+                    days_back: int = 30,
+                    days_forward: int = 30,
+                    max_results: int = 1000,
+                    event_filter: Optional[Callable[[Dict[str, Any]], bool]] = None,
+                    include_attendees: bool = False) -> Iterator[Dict[str, Any]]:
+        """Get events using incremental sync against a locally cached copy.
+        
+        The first call performs a full fetch of the requested range, padded by
+        SYNC_WINDOW_PADDING, and caches the raw events with the sync token
+        returned by the API. Later calls only fetch events changed since then
+        and merge them into the cache by event ID. A full fetch is done again
+        when the requested range leaves the cached one or the API expires the
+        sync token.
+        
+        Args:
+            calendar_id: Calendar ID to fetch events from
+            days_back: Number of days in the past to fetch events
+            days_forward: Number of days in the future to fetch events
+            max_results: Maximum number of events to fetch
+            event_filter: Optional predicate applied to raw API events before processing
+            include_attendees: Include the processed attendee list in each event
+            
+        Yields:
+            Event dictionaries with full metadata, ordered by start time
+            
+        Raises:
+            HttpError: If fetching fails for any reason other than an expired
+                sync token; the cache is left unchanged
+        """
+        if self.service is None:
+            print("Error: Calendar service not initialized. Please authenticate first.")
+            return
+        
+        cache_file = os.path.join(SYNC_CACHE_DIR, quote(calendar_id, safe='') + '.json')
+        time_min, time_max = _time_range(days_back, days_forward)
+        # The padding bounds how long the cached range can cover the requested one
+        state = _read_cache(cache_file, SYNC_WINDOW_PADDING)
+        
+        if (state and state.get('sync_token')
+                and state['time_min'] <= time_min and time_max <= state['time_max']):
+            try:
+                state['sync_token'] = self._fetch_event_changes(
+                    state['events'], calendar_id, syncToken=state['sync_token'])
+            except HttpError as error:
+                # Expired sync tokens are reported as 410 Gone
+                if error.resp.status != 410:
+                    raise
+                print("Sync token expired, performing a full sync...")
+                state = None
+        else:
+            state = None
+        
+        if state is None:
+            padding_days = SYNC_WINDOW_PADDING.days
+            full_min, full_max = _time_range(days_back + padding_days, days_forward + padding_days)
+            state = {'time_min': full_min, 'time_max': full_max, 'events': {}}
+            state['sync_token'] = self._fetch_event_changes(
+                state['events'], calendar_id, timeMin=full_min, timeMax=full_max)
+        
+        _write_cache(cache_file, state)
+        
+        # Narrow the cached events down to the requested range
+        range_start = datetime.fromisoformat(time_min)
+        range_end = datetime.fromisoformat(time_max)
+        events = [
+            event for event in state['events'].values()
+            if _event_time(event.get('end', {})) > range_start
+            and _event_time(event.get('start', {})) < range_end
+        ]
+        events.sort(key=lambda event: _event_time(event.get('start', {})))
+        yield from self._process_events(events[:max_results], event_filter, include_attendees)
+    
+    def _fetch_event_changes(self,
+                             events: Dict[str, Dict[str, Any]],
+                             calendar_id: str,
+                             **params: Any) -> Optional[str]:
+        """Fetch all pages of an events().list() sync query into a dict of raw events.
+        
+        Args:
+            events: Raw events keyed by event ID, updated in place
+            calendar_id: Calendar ID to fetch events from
+            **params: Either syncToken, or timeMin and timeMax for a full sync
+            
+        Returns:
+            The sync token for the next incremental sync, if the API returned one
+        """
+        request = self.service.events().list(  # type: ignore
+            calendarId=calendar_id,
+            maxResults=PAGE_SIZE,
+            singleEvents=True,
+            fields=EVENT_SYNC_FIELDS,
+            **params
+        )
+        sync_token = None
+        
+        while request is not None:
+            response = request.execute()
+            for event in response.get('items', []):
+                if event.get('status') == 'cancelled':
+                    events.pop(event['id'], None)
+                else:
+                    events[event['id']] = event
+            sync_token = response.get('nextSyncToken', sync_token)
+            request = self.service.events().list_next(request, response)  # type: ignore
+            
+        return sync_token
+    
+    def _events_list_request(self,
+                             calendar_id: str,
+                             time_min: str,
+                             time_max: str,
+                             max_results: int) -> Any:
+        """Build an events().list() request for the given calendar and time range.
+        
+        Args:
+            calendar_id: Calendar ID to fetch events from
+            time_min: RFC 3339 lower bound for event end times
+            time_max: RFC 3339 upper bound for event start times
+            max_results: Maximum number of events to return per page
+            
+        Returns:
+            Unexecuted HttpRequest object
+        """
+        return self.service.events().list(  # type: ignore
+            calendarId=calendar_id,
+            timeMin=time_min,
+            timeMax=time_max,
+            maxResults=max_results,
+            singleEvents=True,
+            orderBy='startTime',
+            fields=EVENT_LIST_FIELDS
+        )
+    
+    def _process_events(self,
+                        events: Iterable[Dict[str, Any]],
+                        event_filter: Optional[Callable[[Dict[str, Any]], bool]],
+                        include_attendees: bool) -> Iterator[Dict[str, Any]]:
+        """Process raw events, skipping those rejected by the filter.
+        
+        Args:
+            events: Raw event dictionaries from Google Calendar API
+            event_filter: Optional predicate applied to each raw event
+            include_attendees: Include the processed attendee list in each event
+            
+        Yields:
+            Processed event dictionaries
+        """
+        if event_filter is not None:
+            events = filter(event_filter, events)
+        for event in events:
+            yield self._process_event(event, include_attendees)
+    
+    def _process_event(self, event: Dict[str, Any], include_attendees: bool = False) -> Dict[str, Any]:
         """Process a raw event from Google Calendar API into structured format.
         
         Args:
             event: Raw event dictionary from Google Calendar API
+            include_attendees: Also build the 'attendees' list; otherwise only
+                'attendees_count' is set, which is all the export needs
             
         Returns:
             Processed event dictionary with structured metadata
@@ -206,17 +776,8 @@ class GoogleCalendarExporter:
             end_time = end.get('dateTime', '')
             all_day = False
             
-        # Process attendees
-        attendees = []
-        for attendee in event.get('attendees', []):
-            attendees.append({
-                'email': attendee.get('email', ''),
-                'display_name': attendee.get('displayName', ''),
-                'response_status': attendee.get('responseStatus', 'needsAction'),
-                'optional': attendee.get('optional', False),
-                'organizer': attendee.get('organizer', False),
-                'self': attendee.get('self', False)
-            })
+        raw_attendees = event.get('attendees', ())
+        organizer = event.get('organizer', {})
         
         # Process recurrence rules
         # recurrence_rules = event.get('recurrence', [])
@@ -231,7 +792,9 @@ class GoogleCalendarExporter:
         #             'minutes': override.get('minutes', 10)
         #         })
         
-        return {
+        # Emails, time zones, colors and types repeat across thousands of events;
+        # interning them keeps a single copy of each string in memory
+        processed_event = {
             'id': event.get('id', ''),
             'summary': event.get('summary', 'No Title'),
             'description': event.get('description', ''),
@@ -239,65 +802,107 @@ class GoogleCalendarExporter:
             'start_time': start_time,
             'end_time': end_time,
             'all_day': all_day,
-            'timezone': start.get('timeZone', '') or end.get('timeZone', ''),
+            'timezone': sys.intern(start.get('timeZone', '') or end.get('timeZone', '')),
             'created': event.get('created', ''),
             'updated': event.get('updated', ''),
             'organizer': {
-                'email': event.get('organizer', {}).get('email', ''),
-                'self': event.get('organizer', {}).get('self', False)
+                'email': sys.intern(organizer.get('email', '')),
+                'self': organizer.get('self', False)
             },
-            'attendees': attendees,
-            'attendees_count': len(attendees),
+            'attendees_count': len(raw_attendees),
             'recurring_event_id': event.get('recurringEventId', ''),
-            'color_id': event.get('colorId', ''),
-            'event_type': event.get('eventType', ''),
+            'color_id': sys.intern(event.get('colorId', '')),
+            'event_type': sys.intern(event.get('eventType', '')),
         }
+        
+        # Process attendees
+        if include_attendees:
+            processed_event['attendees'] = [{
+                'email': sys.intern(attendee.get('email', '')),
+                'display_name': attendee.get('displayName', ''),
+                'response_status': sys.intern(attendee.get('responseStatus', 'needsAction')),
+                'optional': attendee.get('optional', False),
+                'organizer': attendee.get('organizer', False),
+                'self': attendee.get('self', False)
+            } for attendee in raw_attendees]
+            
+        return processed_event
     
     def export_to_json(self, 
-                       events: List[Dict[str, Any]], 
+                       events: Iterable[Dict[str, Any]], 
                        filename: str,
-                       calendar_info: Optional[Dict[str, Any]] = None) -> bool:
+                       calendar_info: Optional[Dict[str, Any]] = None,
+                       stats: Optional[ExportStats] = None,
+                       compact: bool = False) -> bool:
         """Export events to JSON file.
         
+        The events are consumed exactly once, so a generator such as the one
+        returned by get_events() can be passed directly.
+        
         Args:
-            events: List of processed events
+            events: Iterable of processed events
             filename: Output filename
             calendar_info: Optional calendar metadata
+            stats: Optional counters that each written event is added to;
+                existing counts are kept, so one instance can span several exports
+            compact: Write each value without indentation, one event per line,
+                which roughly halves the file size
             
         Returns:
             True if export successful, False otherwise
         """
+        tmp_file = filename + '.tmp'
         try:
-            # Remove attendees field from events before export
-            cleaned_events = []
-            for event in events:
-                cleaned_event = {k: v for k, v in event.items() if k != 'attendees'}
-                cleaned_events.append(cleaned_event)
-            
             # Fetch color definitions
             color_definitions = self.get_color_definitions()
             
-            export_data = {
-                'export_timestamp': datetime.utcnow().isoformat() + 'Z',
-                'total_events': len(cleaned_events),
-                'calendar_info': calendar_info or {},
-                'color_definitions': color_definitions,
-                'events': cleaned_events
-            }
+            header_indent = None if compact else b'  '
+            event_indent = None if compact else b'    '
             
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(export_data, f, indent=2, ensure_ascii=False)
+            # Write the header fields first, then stream the events so only a
+            # single event is serialized in memory at a time. UTF-8 bytes go
+            # straight into a large write buffer, bypassing the text codec.
+            # The event count is only known at the end, so it is written last.
+            # Output goes to a temporary file that only replaces the target
+            # once every event has been written, so a failed fetch never
+            # leaves a truncated export behind.
+            total_events = 0
+            with open(tmp_file, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+                f.write(b'{\n  "export_timestamp": ')
+                f.write(_json_bytes(_utc_isoformat(datetime.now(timezone.utc))))
+                f.write(b',\n  "calendar_info": ')
+                f.write(_json_bytes(calendar_info or {}, header_indent))
+                f.write(b',\n  "color_definitions": ')
+                f.write(_json_bytes(color_definitions, header_indent))
+                f.write(b',\n  "events": [')
+                separator = b'\n    '
+                for event in events:
+                    f.write(separator)
+                    separator = b',\n    '
+                    # Remove attendees field from events before export
+                    if 'attendees' in event:
+                        event = {k: v for k, v in event.items() if k != 'attendees'}
+                    f.write(_json_bytes(event, event_indent))
+                    total_events += 1
+                    if stats is not None:
+                        stats.add(event)
+                f.write(b'\n  ],\n  "total_events": %d\n}\n' % total_events)
+            os.replace(tmp_file, filename)
                 
-            print(f"Successfully exported {len(events)} events to {filename}")
+            print(f"Successfully exported {total_events} events to {filename}")
             return True
             
         except Exception as e:
             print(f"Error exporting to JSON: {e}")
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
             return False
 
     def get_color_definitions(self) -> Dict[str, Any]:
         """Get color definitions for calendars and events.
         
+        The definitions are cached in COLOR_CACHE_FILE for COLOR_CACHE_TTL.
+        
         Returns:
             Dictionary containing color ID to hex color mappings
         """
@@ -305,8 +910,15 @@ class GoogleCalendarExporter:
             print("Error: Calendar service not initialized. Please authenticate first.")
             return {}
         
+        if self._color_definitions is None:
+            self._color_definitions = _read_cache(COLOR_CACHE_FILE, COLOR_CACHE_TTL)
+        if self._color_definitions is not None:
+            return self._color_definitions
+        
         try:
-            colors_result = self.service.colors().get().execute()
+            colors_result = self.service.colors().get(fields=COLOR_FIELDS).execute()
+            _write_cache(COLOR_CACHE_FILE, colors_result)
+            self._color_definitions = colors_result
             return colors_result
         except HttpError as error:
             print(f"An error occurred while fetching colors: {error}")
@@ -319,49 +931,66 @@ class GoogleCalendarExporter:
         1. Check if you're in the attendees list with accepted/tentative status
         2. Check if you're the organizer (implicitly accepted)
         3. Check if there are no attendees (likely your personal event)
+        4. Fall back to a single accepted attendee when 'self' is not set
         
         Args:
-            event: Event dictionary from the calendar export
+            event: Event dictionary from the calendar export, processed with
+                include_attendees=True so that it carries its attendee list
             
         Returns:
             True if the event is accepted or tentatively accepted, False otherwise
         """
-        # Strategy 1: Check attendees list for your response
-        attendees = event.get('attendees', [])
+        return self._is_accepted(event, 'response_status')
+    
+    def _is_raw_event_accepted(self, event: Dict[str, Any]) -> bool:
+        """Apply is_event_accepted_by_me() to a raw API event, for use as an event_filter.
         
-        # First, look for attendee marked as 'self'
+        Args:
+            event: Raw event dictionary from Google Calendar API
+            
+        Returns:
+            True if the event is accepted or tentatively accepted, False otherwise
+        """
+        return self._is_accepted(event, 'responseStatus')
+    
+    def _is_accepted(self, event: Dict[str, Any], status_key: str) -> bool:
+        """Run the acceptance strategies of is_event_accepted_by_me().
+        
+        The attendees are scanned once, returning as soon as your entry is found.
+        
+        Args:
+            event: Processed or raw event dictionary
+            status_key: Attendee key holding the response status, which is
+                'response_status' for processed and 'responseStatus' for raw events
+            
+        Returns:
+            True if the event is accepted or tentatively accepted, False otherwise
+        """
+        # Strategy 1: Check attendees list for your response. A single pass
+        # looks for the attendee marked as 'self' and counts accepted attendees
+        # for the fallback in strategy 4.
+        attendees = event.get('attendees', ())
+        accepted_count = 0
         for attendee in attendees:
+            response_status = attendee.get(status_key, '')
             if attendee.get('self', False):
-                response_status = attendee.get('response_status', '')
-                return response_status in ['accepted', 'tentative']
+                return response_status in ACCEPTED_STATUSES
+            if response_status in ACCEPTED_STATUSES:
+                accepted_count += 1
         
         # Strategy 2: Check if you're the organizer (implicitly accepted)
-        organizer = event.get('organizer', {})
-        if organizer.get('self', False):
+        if event.get('organizer', {}).get('self', False):
             return True
         
         # Strategy 3: If no attendees, this is likely your personal event
+        # (This also handles cases where the API doesn't populate attendee data properly)
         if not attendees:
             return True
             
-        # Strategy 4: Check if any attendee has accepted status and looks like it could be you
+        # Strategy 4: If there's only one attendee with accepted status, assume it's you
         # This is a fallback when 'self' field isn't properly set
-        for attendee in attendees:
-            response_status = attendee.get('response_status', '')
-            if response_status in ['accepted', 'tentative']:
-                # If there's only one attendee with accepted status, assume it's you
-                # (This is imperfect but better than missing events)
-                accepted_attendees = [a for a in attendees if a.get('response_status') in ['accepted', 'tentative']]
-                if len(accepted_attendees) == 1:
-                    return True
-        
-        # Strategy 5: If you're accessing events from your primary calendar, 
-        # and no attendees are marked, assume these are your events
-        # (This handles cases where the API doesn't populate attendee data properly)
-        if not attendees and event.get('summary', ''):
-            return True
-        
-        return False
+        # (This is imperfect but better than missing events)
+        return accepted_count == 1
 
 def main() -> None:
     """Main function to run the calendar export tool."""
@@ -382,6 +1011,10 @@ def main() -> None:
                        help='Path to Google OAuth2 credentials file (default: credentials.json)')
     parser.add_argument('--accepted-only', action='store_true',
                        help='Only export events that you have accepted or tentatively accepted')
+    parser.add_argument('--incremental', action='store_true',
+                       help='Only fetch events changed since the last incremental run')
+    parser.add_argument('--compact', action='store_true',
+                       help='Write compact JSON without indentation, one event per line')
     
     args = parser.parse_args()
     
@@ -415,61 +1048,74 @@ def main() -> None:
         return
     
     # Get calendar info
-    calendars = exporter.get_calendars()
-    calendar_info = None
-    for calendar in calendars:
-        if calendar['id'] == args.calendar_id:
-            calendar_info = calendar
-            break
+    calendar_info = exporter.get_calendar(args.calendar_id)
     
     if calendar_info:
         print(f"\nExporting from calendar: {calendar_info['summary']}")
     else:
         print(f"\nExporting from calendar ID: {args.calendar_id}")
     
+    # Filter events if requested; the check runs on the raw API events so the
+    # attendee lists never have to be processed
+    fetched_count = 0
+    event_filter: Optional[Callable[[Dict[str, Any]], bool]] = None
+    if args.accepted_only:
+        def is_accepted(event: Dict[str, Any]) -> bool:
+            """Count a fetched raw event and report whether it was accepted."""
+            nonlocal fetched_count
+            fetched_count += 1
+            return exporter._is_raw_event_accepted(event)
+        
+        event_filter = is_accepted
+    
     # Fetch events
     print(f"Fetching events ({args.days_back} days back, {args.days_forward} days forward)...")
-    events = exporter.get_events(
+    fetch_events = exporter.sync_events if args.incremental else exporter.get_events
+    events = fetch_events(
         calendar_id=args.calendar_id,
         days_back=args.days_back,
         days_forward=args.days_forward,
-        max_results=args.max_results
+        max_results=args.max_results,
+        event_filter=event_filter
     )
     
-    if not events:
-        print("No events found in the specified time range.")
+    # Peek at the first event so an empty range is reported before creating the file
+    try:
+        first_event = next(events, None)
+    except HttpError as error:
+        print(f"An error occurred while fetching events: {error}")
+        return
+    if first_event is None:
+        if fetched_count:
+            print(f"None of the {fetched_count} events found are accepted/tentative.")
+        else:
+            print("No events found in the specified time range.")
         return
     
-    print(f"Found {len(events)} events.")
+    events_to_export = itertools.chain([first_event], events)
     
-    # Filter events if requested
-    if args.accepted_only:
-        accepted_events = [event for event in events if exporter.is_event_accepted_by_me(event)]
-        print(f"Filtered to {len(accepted_events)} accepted/tentative events.")
-        events_to_export = accepted_events
-    else:
-        events_to_export = events
+    # Summary counters are updated by export_to_json as each event is written
+    stats = ExportStats()
     
     # Export to JSON
     print(f"Exporting to {args.output}...")
-    if exporter.export_to_json(events_to_export, args.output, calendar_info):
+    if exporter.export_to_json(events_to_export, args.output, calendar_info, stats, args.compact):
         print("Export completed successfully!")
         
         # Print summary
         print("\nExport Summary:")
-        print(f"- Total events: {len(events_to_export)}")
+        print(f"- Total events: {stats.total}")
+        if args.accepted_only:
+            print(f"- Filtered from {fetched_count} events to accepted/tentative only")
         print(f"- Output file: {args.output}")
         print(f"- Time range: {args.days_back} days back to {args.days_forward} days forward")
         
         # Count event types
-        all_day_count = sum(1 for event in events_to_export if event['all_day'])
-        timed_count = len(events_to_export) - all_day_count
-        print(f"- All-day events: {all_day_count}")
-        print(f"- Timed events: {timed_count}")
+        print(f"- All-day events: {stats.all_day}")
+        print(f"- Timed events: {stats.timed}")
         
         # Count events with attendees
-        events_with_attendees = sum(1 for event in events_to_export if event['attendees_count'] > 0)
-        print(f"- Events with attendees: {events_with_attendees}")
+        print(f"- Events with attendees: {stats.with_attendees}")
         
     else:
         print("Export failed.")
@@ -0,0 +1,185 @@
+"""Fake Calendar API service for tests that page events from several calendars."""
+
+from __future__ import annotations
+
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+import httplib2  # type: ignore
+from googleapiclient.errors import HttpError  # type: ignore
+
+
+def make_event(event_id: str) -> Dict[str, Any]:
+    """Build a minimal raw API event starting in one hour.
+
+    Args:
+        event_id: Event ID
+
+    Returns:
+        Raw event dictionary as returned by events().list()
+    """
+    start = datetime.now(timezone.utc) + timedelta(hours=1)
+    return {
+        'id': event_id,
+        'summary': f'Event {event_id}',
+        'start': {'dateTime': start.isoformat()},
+        'end': {'dateTime': (start + timedelta(hours=1)).isoformat()},
+    }
+
+
+class FakeRequest:
+    """Stand-in for an events().list() HTTP request."""
+
+    def __init__(self, resource: FakeEventsResource, params: Dict[str, Any]) -> None:
+        """Store the query parameters of the request.
+
+        Args:
+            resource: Resource that answers the request
+            params: Query parameters passed to list()
+        """
+        self.resource = resource
+        self.params = params
+
+    def execute(self) -> Dict[str, Any]:
+        """Answer the request from the fake resource.
+
+        Returns:
+            Events list response
+        """
+        return self.resource.respond(self.params)
+
+
+class FakeEventsResource:
+    """Fake events() resource paging each calendar's events by maxResults."""
+
+    def __init__(self, calendars: Dict[str, List[Dict[str, Any]]]) -> None:
+        """Initialize the resource with the events of each calendar.
+
+        Args:
+            calendars: Raw events keyed by calendar ID
+        """
+        self.calendars = calendars
+        # (calendar ID, page token) pairs that answer with 500
+        self.failing_pages: Set[Tuple[str, Optional[str]]] = set()
+        self.calls: List[Dict[str, Any]] = []
+        # Identifiers of the threads that executed requests
+        self.threads: Set[int] = set()
+
+    def list(self, **params: Any) -> FakeRequest:
+        """Create a list request.
+
+        Args:
+            **params: Query parameters
+
+        Returns:
+            Request for the first page
+        """
+        return FakeRequest(self, params)
+
+    def list_next(self, request: FakeRequest, response: Dict[str, Any]) -> Optional[FakeRequest]:
+        """Create the request for the page following response.
+
+        Args:
+            request: Previous request
+            response: Response to the previous request
+
+        Returns:
+            Request for the next page, or None after the last page
+        """
+        if 'nextPageToken' not in response:
+            return None
+        return FakeRequest(self, {**request.params, 'pageToken': response['nextPageToken']})
+
+    def respond(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the response for one page of a calendar.
+
+        Args:
+            params: Query parameters of the request
+
+        Returns:
+            Events list response
+
+        Raises:
+            HttpError: With status 500 for pages listed in failing_pages
+        """
+        self.calls.append(params)
+        self.threads.add(threading.get_ident())
+        page_token = params.get('pageToken')
+        if (params['calendarId'], page_token) in self.failing_pages:
+            raise HttpError(httplib2.Response({'status': 500}), b'Backend Error')
+
+        items = self.calendars[params['calendarId']]
+        offset = int(page_token or 0)
+        page_size = params['maxResults']
+        response: Dict[str, Any] = {'items': items[offset:offset + page_size]}
+        if offset + page_size < len(items):
+            response['nextPageToken'] = str(offset + page_size)
+        return response
+
+
+class FakeBatch:
+    """Fake batch request that runs its requests in order."""
+
+    def __init__(self, service: FakeService,
+                 callback: Callable[[str, Optional[Dict[str, Any]], Optional[Exception]], None]) -> None:
+        """Create an empty batch.
+
+        Args:
+            service: Service recording the size of each executed batch
+            callback: Called with (request_id, response, exception) for each request
+        """
+        self.service = service
+        self.callback = callback
+        self.requests: List[Tuple[FakeRequest, str]] = []
+
+    def add(self, request: FakeRequest, request_id: str) -> None:
+        """Queue a request.
+
+        Args:
+            request: Request to run
+            request_id: ID passed back to the callback
+        """
+        self.requests.append((request, request_id))
+
+    def execute(self) -> None:
+        """Run every queued request and report each result to the callback."""
+        self.service.batch_sizes.append(len(self.requests))
+        for request, request_id in self.requests:
+            try:
+                self.callback(request_id, request.execute(), None)
+            except HttpError as error:
+                self.callback(request_id, None, error)
+
+
+class FakeService:
+    """Fake Calendar API service exposing events() and batch requests."""
+
+    def __init__(self, calendars: Dict[str, List[Dict[str, Any]]]) -> None:
+        """Create the service with the events of each calendar.
+
+        Args:
+            calendars: Raw events keyed by calendar ID
+        """
+        self._events = FakeEventsResource(calendars)
+        self.batch_sizes: List[int] = []
+
+    def events(self) -> FakeEventsResource:
+        """Return the events() resource.
+
+        Returns:
+            The fake events() resource
+        """
+        return self._events
+
+    def new_batch_http_request(
+            self, callback: Callable[[str, Optional[Dict[str, Any]], Optional[Exception]], None]) -> FakeBatch:
+        """Create a batch request.
+
+        Args:
+            callback: Called with (request_id, response, exception) for each request
+
+        Returns:
+            Empty fake batch
+        """
+        return FakeBatch(self, callback)
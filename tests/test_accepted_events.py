@@ -0,0 +1,53 @@
+"""Tests for GoogleCalendarExporter.is_event_accepted_by_me()."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict
+
+import pytest
+
+from main import GoogleCalendarExporter
+
+if TYPE_CHECKING:
+    from _pytest.capture import CaptureFixture
+    from _pytest.fixtures import FixtureRequest
+    from _pytest.logging import LogCaptureFixture
+    from _pytest.monkeypatch import MonkeyPatch
+    from pytest_mock.plugin import MockerFixture  # type: ignore
+
+
+def raw_event(my_status: str) -> Dict[str, Any]:
+    """Build a raw API event that you were invited to.
+
+    Args:
+        my_status: Your responseStatus
+
+    Returns:
+        Raw event dictionary as returned by events().list()
+    """
+    return {
+        'id': 'meeting',
+        'start': {'dateTime': '2026-10-15T10:00:00Z'},
+        'end': {'dateTime': '2026-10-15T11:00:00Z'},
+        'organizer': {'email': 'boss@example.com'},
+        'attendees': [
+            {'email': 'boss@example.com', 'organizer': True, 'responseStatus': 'accepted'},
+            {'email': 'me@example.com', 'self': True, 'responseStatus': my_status},
+        ],
+    }
+
+
+@pytest.mark.parametrize('my_status, expected', [
+    ('accepted', True),
+    ('tentative', True),
+    ('declined', False),
+    ('needsAction', False),
+])
+def test_processed_and_raw_events_agree(my_status: str, expected: bool) -> None:
+    """The public check on processed events matches the raw-event filter used by main()."""
+    exporter = GoogleCalendarExporter()
+    event = raw_event(my_status)
+    processed = exporter._process_event(event, include_attendees=True)
+
+    assert exporter.is_event_accepted_by_me(processed) is expected
+    assert exporter._is_raw_event_accepted(event) is expected
@@ -0,0 +1,115 @@
+"""Tests for concurrent fetching in GoogleCalendarExporter.get_events_many()."""
+
+from __future__ import annotations
+
+import json
+import threading
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, List
+
+import pytest
+
+import main
+from main import GoogleCalendarExporter
+from tests.fakes import FakeService, make_event
+
+if TYPE_CHECKING:
+    from _pytest.capture import CaptureFixture
+    from _pytest.fixtures import FixtureRequest
+    from _pytest.logging import LogCaptureFixture
+    from _pytest.monkeypatch import MonkeyPatch
+    from pytest_mock.plugin import MockerFixture  # type: ignore
+
+
+@pytest.fixture
+def service(monkeypatch: MonkeyPatch, tmp_path: Path) -> FakeService:
+    """Provide a fake service with two calendars, paged two events at a time.
+
+    Args:
+        monkeypatch: Pytest monkeypatch fixture
+        tmp_path: Temporary directory for the sync cache
+
+    Returns:
+        Fake Calendar API service
+    """
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(main, 'PAGE_SIZE', 2)
+    return FakeService({
+        'work': [make_event(f'w{i}') for i in range(3)],
+        'home': [make_event('h0')],
+    })
+
+
+@pytest.fixture
+def exporter(service: FakeService) -> GoogleCalendarExporter:
+    """Provide an exporter backed by the fake service.
+
+    Args:
+        service: Fake Calendar API service
+
+    Returns:
+        Exporter ready to fetch events
+    """
+    exporter = GoogleCalendarExporter()
+    exporter.service = service
+    return exporter
+
+
+@pytest.mark.parametrize('incremental', [False, True])
+def test_each_calendar_is_fetched_in_a_worker_thread(exporter: GoogleCalendarExporter,
+                                                      service: FakeService,
+                                                      incremental: bool) -> None:
+    """Every calendar is paginated completely, off the calling thread."""
+    results = exporter.get_events_many(['work', 'home'], incremental=incremental)
+
+    assert [event['id'] for event in results['work']] == ['w0', 'w1', 'w2']
+    assert [event['id'] for event in results['home']] == ['h0']
+    assert threading.get_ident() not in service.events().threads
+
+
+@pytest.mark.parametrize('incremental', [False, True])
+def test_failed_calendar_is_returned_empty(exporter: GoogleCalendarExporter,
+                                           service: FakeService,
+                                           incremental: bool,
+                                           capsys: CaptureFixture[str]) -> None:
+    """A calendar whose fetch fails is reported and dropped without affecting the others."""
+    service.events().failing_pages.add(('work', '2'))
+
+    results = exporter.get_events_many(['work', 'home'], incremental=incremental)
+
+    assert results['work'] == []
+    assert [event['id'] for event in results['home']] == ['h0']
+    assert 'for work' in capsys.readouterr().out
+
+
+def test_each_thread_gets_its_own_http_client(monkeypatch: MonkeyPatch, tmp_path: Path) -> None:
+    """Requests built on one thread share a client that no other thread uses."""
+    monkeypatch.chdir(tmp_path)
+    expiry = datetime.now(timezone.utc).replace(tzinfo=None) + timedelta(hours=1)
+    Path(main.TOKEN_FILE).write_text(json.dumps({
+        'token': 'access-token',
+        'refresh_token': 'refresh-token',
+        'client_id': 'client-id',
+        'client_secret': 'client-secret',
+        'expiry': expiry.isoformat() + 'Z',
+    }))
+    exporter = GoogleCalendarExporter()
+    assert exporter.authenticate()
+    service = exporter.service
+    assert service is not None
+
+    def request_http() -> Any:
+        """Build an events().list() request and return its HTTP client."""
+        return service.events().list(calendarId='primary').http
+
+    main_http = request_http()
+    worker_http: List[Any] = []
+    worker = threading.Thread(target=lambda: worker_http.extend([request_http(), request_http()]))
+    worker.start()
+    worker.join()
+
+    assert request_http() is main_http
+    assert worker_http[0] is worker_http[1]
+    assert worker_http[0] is not main_http
+    assert main_http.http.timeout is not None
@@ -0,0 +1,116 @@
+"""Tests for batched fetching in GoogleCalendarExporter.get_events_multi()."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, List
+
+import pytest
+
+import main
+from main import GoogleCalendarExporter
+from tests.fakes import FakeService, make_event
+
+if TYPE_CHECKING:
+    from _pytest.capture import CaptureFixture
+    from _pytest.fixtures import FixtureRequest
+    from _pytest.logging import LogCaptureFixture
+    from _pytest.monkeypatch import MonkeyPatch
+    from pytest_mock.plugin import MockerFixture  # type: ignore
+
+
+@pytest.fixture
+def service(monkeypatch: MonkeyPatch) -> FakeService:
+    """Provide a fake service with a five-event and a one-event calendar, paged two at a time.
+
+    Args:
+        monkeypatch: Pytest monkeypatch fixture
+
+    Returns:
+        Fake Calendar API service
+    """
+    monkeypatch.setattr(main, 'PAGE_SIZE', 2)
+    return FakeService({
+        'work': [make_event(f'w{i}') for i in range(5)],
+        'home': [make_event('h0')],
+    })
+
+
+@pytest.fixture
+def exporter(service: FakeService) -> GoogleCalendarExporter:
+    """Provide an exporter backed by the fake service.
+
+    Args:
+        service: Fake Calendar API service
+
+    Returns:
+        Exporter ready to fetch events
+    """
+    exporter = GoogleCalendarExporter()
+    exporter.service = service
+    return exporter
+
+
+def ids(events: List[Dict[str, Any]]) -> List[str]:
+    """Return the IDs of processed events.
+
+    Args:
+        events: Processed events
+
+    Returns:
+        Event IDs in order
+    """
+    return [event['id'] for event in events]
+
+
+def test_truncated_first_page_is_continued(exporter: GoogleCalendarExporter, service: FakeService) -> None:
+    """First pages come from one batch; a truncated one is followed with list_next()."""
+    results = exporter.get_events_multi(['work', 'home'])
+
+    assert ids(results['work']) == ['w0', 'w1', 'w2', 'w3', 'w4']
+    assert ids(results['home']) == ['h0']
+    assert service.batch_sizes == [2]
+    assert [call.get('pageToken') for call in service.events().calls] == [None, None, '2', '4']
+
+
+def test_max_results_caps_each_calendar(exporter: GoogleCalendarExporter) -> None:
+    """Pagination stops once max_results events were fetched for a calendar."""
+    results = exporter.get_events_multi(['work', 'home'], max_results=3)
+
+    assert ids(results['work']) == ['w0', 'w1', 'w2']
+    assert ids(results['home']) == ['h0']
+
+
+def test_failed_later_page_drops_the_calendar(exporter: GoogleCalendarExporter,
+                                             service: FakeService,
+                                             capsys: CaptureFixture[str]) -> None:
+    """A calendar whose later page fails is returned empty instead of truncated."""
+    service.events().failing_pages.add(('work', '4'))
+
+    results = exporter.get_events_multi(['work', 'home'])
+
+    assert results['work'] == []
+    assert ids(results['home']) == ['h0']
+    assert 'for work' in capsys.readouterr().out
+
+
+def test_failed_first_page_only_affects_its_calendar(exporter: GoogleCalendarExporter,
+                                                     service: FakeService) -> None:
+    """An error reported through the batch callback leaves the other calendars intact."""
+    service.events().failing_pages.add(('home', None))
+
+    results = exporter.get_events_multi(['work', 'home'])
+
+    assert len(results['work']) == 5
+    assert results['home'] == []
+
+
+def test_batches_are_split_at_batch_limit(exporter: GoogleCalendarExporter, service: FakeService) -> None:
+    """More than BATCH_LIMIT calendars are spread over several batches."""
+    calendar_ids = [f'cal{i}' for i in range(main.BATCH_LIMIT + 1)]
+    for calendar_id in calendar_ids:
+        service.events().calendars[calendar_id] = [make_event(f'{calendar_id}-0')]
+
+    results = exporter.get_events_multi(calendar_ids)
+
+    assert service.batch_sizes == [main.BATCH_LIMIT, 1]
+    assert all(ids(results[calendar_id]) == [f'{calendar_id}-0'] for calendar_id in calendar_ids)
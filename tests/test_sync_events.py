@@ -0,0 +1,264 @@
+"""Tests for incremental sync in GoogleCalendarExporter.sync_events()."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+import httplib2  # type: ignore
+import pytest
+from googleapiclient.errors import HttpError  # type: ignore
+
+from main import GoogleCalendarExporter
+
+if TYPE_CHECKING:
+    from _pytest.capture import CaptureFixture
+    from _pytest.fixtures import FixtureRequest
+    from _pytest.logging import LogCaptureFixture
+    from _pytest.monkeypatch import MonkeyPatch
+    from pytest_mock.plugin import MockerFixture  # type: ignore
+
+
+def make_event(event_id: str, hours_from_now: int) -> Dict[str, Any]:
+    """Build a one-hour raw API event starting relative to the current time.
+
+    Args:
+        event_id: Event ID
+        hours_from_now: Start time offset from now in hours
+
+    Returns:
+        Raw event dictionary as returned by events().list()
+    """
+    start = datetime.now(timezone.utc) + timedelta(hours=hours_from_now)
+    end = start + timedelta(hours=1)
+    return {
+        'id': event_id,
+        'status': 'confirmed',
+        'summary': f'Event {event_id}',
+        'start': {'dateTime': start.isoformat()},
+        'end': {'dateTime': end.isoformat()},
+    }
+
+
+class FakeRequest:
+    """Stand-in for an events().list() HTTP request."""
+
+    def __init__(self, resource: FakeEventsResource, params: Dict[str, Any]) -> None:
+        """Store the query parameters of the request.
+
+        Args:
+            resource: Resource that answers the request
+            params: Query parameters passed to list()
+        """
+        self.resource = resource
+        self.params = params
+
+    def execute(self) -> Dict[str, Any]:
+        """Answer the request from the fake resource.
+
+        Returns:
+            Events list response
+        """
+        return self.resource.respond(self.params)
+
+
+class FakeEventsResource:
+    """Fake events() resource serving full syncs, sync token deltas and 410 errors."""
+
+    def __init__(self, events: List[Dict[str, Any]], page_size: int = 2) -> None:
+        """Initialize the resource with the events currently on the server.
+
+        Args:
+            events: Raw events returned by a full sync
+            page_size: Number of events per page
+        """
+        self.events = events
+        self.page_size = page_size
+        self.changes: List[Dict[str, Any]] = []
+        self.token_expired = False
+        self.error_status: Optional[int] = None
+        self.calls: List[Dict[str, Any]] = []
+
+    def list(self, **params: Any) -> FakeRequest:
+        """Create a list request.
+
+        Args:
+            **params: Query parameters
+
+        Returns:
+            Request for the first page
+        """
+        return FakeRequest(self, params)
+
+    def list_next(self, request: FakeRequest, response: Dict[str, Any]) -> Optional[FakeRequest]:
+        """Create the request for the page following response.
+
+        Args:
+            request: Previous request
+            response: Response to the previous request
+
+        Returns:
+            Request for the next page, or None after the last page
+        """
+        if 'nextPageToken' not in response:
+            return None
+        return FakeRequest(self, {**request.params, 'pageToken': response['nextPageToken']})
+
+    def respond(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the response for one page of a full or incremental sync.
+
+        Args:
+            params: Query parameters of the request
+
+        Returns:
+            Events list response
+
+        Raises:
+            HttpError: With error_status when set, or 410 when the sync token has expired
+        """
+        self.calls.append(params)
+        if self.error_status is not None:
+            raise HttpError(httplib2.Response({'status': self.error_status}), b'Backend Error')
+        if 'syncToken' in params:
+            if self.token_expired:
+                raise HttpError(httplib2.Response({'status': 410}), b'Sync token is no longer valid')
+            items = self.changes
+        else:
+            items = self.events
+
+        offset = int(params.get('pageToken', 0))
+        response: Dict[str, Any] = {'items': items[offset:offset + self.page_size]}
+        if offset + self.page_size < len(items):
+            response['nextPageToken'] = str(offset + self.page_size)
+        else:
+            response['nextSyncToken'] = f'token-{len(self.calls)}'
+        return response
+
+
+class FakeService:
+    """Fake Calendar API service exposing only the events() resource."""
+
+    def __init__(self, events: FakeEventsResource) -> None:
+        """Wrap the fake events() resource.
+
+        Args:
+            events: Resource returned by events()
+        """
+        self._events = events
+
+    def events(self) -> FakeEventsResource:
+        """Return the events() resource.
+
+        Returns:
+            The fake events() resource
+        """
+        return self._events
+
+
+@pytest.fixture
+def resource(monkeypatch: MonkeyPatch, tmp_path: Path) -> FakeEventsResource:
+    """Provide a fake events() resource and keep the sync cache in a temporary directory.
+
+    Args:
+        monkeypatch: Pytest monkeypatch fixture
+        tmp_path: Temporary directory for the sync cache
+
+    Returns:
+        Fake events() resource holding three upcoming events
+    """
+    monkeypatch.chdir(tmp_path)
+    return FakeEventsResource([make_event('a', 1), make_event('b', 2), make_event('c', 3)])
+
+
+@pytest.fixture
+def exporter(resource: FakeEventsResource) -> GoogleCalendarExporter:
+    """Provide an exporter whose service is backed by the fake resource.
+
+    Args:
+        resource: Fake events() resource
+
+    Returns:
+        Exporter ready to sync events
+    """
+    exporter = GoogleCalendarExporter()
+    exporter.service = FakeService(resource)
+    return exporter
+
+
+def sync_ids(exporter: GoogleCalendarExporter, days_back: int = 30) -> List[str]:
+    """Run sync_events() and return the IDs of the events it yields.
+
+    Args:
+        exporter: Exporter to sync with
+        days_back: Number of days in the past to sync
+
+    Returns:
+        Event IDs in the order they were yielded
+    """
+    return [event['id'] for event in exporter.sync_events('primary', days_back=days_back, days_forward=30)]
+
+
+def test_first_sync_fetches_all_pages(exporter: GoogleCalendarExporter, resource: FakeEventsResource) -> None:
+    """The first sync performs a full fetch across every page and caches the token."""
+    assert sync_ids(exporter) == ['a', 'b', 'c']
+    assert len(resource.calls) == 2
+    assert all('syncToken' not in call for call in resource.calls)
+    assert (Path('.cache') / 'sync' / 'primary.json').exists()
+
+
+def test_second_sync_merges_changes(exporter: GoogleCalendarExporter, resource: FakeEventsResource) -> None:
+    """A later sync sends the sync token and merges updates, additions and cancellations."""
+    sync_ids(exporter)
+    updated = {**make_event('b', 2), 'summary': 'Moved'}
+    resource.changes = [{'id': 'a', 'status': 'cancelled'}, updated, make_event('d', 4)]
+    resource.calls.clear()
+
+    events = list(exporter.sync_events('primary', days_back=30, days_forward=30))
+
+    assert [event['id'] for event in events] == ['b', 'c', 'd']
+    assert events[0]['summary'] == 'Moved'
+    assert resource.calls[0]['syncToken'] == 'token-2'
+    assert 'timeMin' not in resource.calls[0]
+
+
+def test_expired_sync_token_falls_back_to_full_sync(exporter: GoogleCalendarExporter,
+                                                    resource: FakeEventsResource,
+                                                    capsys: CaptureFixture[str]) -> None:
+    """A 410 Gone response discards the cache and performs a full sync."""
+    sync_ids(exporter)
+    resource.token_expired = True
+    resource.events = [make_event('a', 1), make_event('e', 5)]
+    resource.calls.clear()
+
+    assert sync_ids(exporter) == ['a', 'e']
+    assert 'syncToken' in resource.calls[0]
+    assert all('syncToken' not in call for call in resource.calls[1:])
+    assert 'Sync token expired' in capsys.readouterr().out
+
+
+def test_range_outside_cached_window_triggers_full_sync(exporter: GoogleCalendarExporter,
+                                                        resource: FakeEventsResource) -> None:
+    """Requesting a range wider than the cached one ignores the sync token."""
+    sync_ids(exporter)
+    resource.events.append(make_event('old', -24 * 50))
+    resource.calls.clear()
+
+    assert sync_ids(exporter, days_back=60) == ['old', 'a', 'b', 'c']
+    assert resource.calls
+    assert all('syncToken' not in call for call in resource.calls)
+
+
+def test_other_errors_propagate_and_keep_the_cache(exporter: GoogleCalendarExporter,
+                                                   resource: FakeEventsResource) -> None:
+    """Errors other than 410 Gone are raised instead of ending the sync empty."""
+    sync_ids(exporter)
+    cache_file = Path('.cache') / 'sync' / 'primary.json'
+    cached = cache_file.read_bytes()
+    resource.error_status = 500
+
+    with pytest.raises(HttpError) as excinfo:
+        sync_ids(exporter)
+
+    assert excinfo.value.resp.status == 500
+    assert cache_file.read_bytes() == cached